@@ -18,5 +18,20 @@ class Settings(BaseSettings):
     postgres_host: Optional[str] = None
     postgres_port: Optional[int] = None
 
+    postgres_pool_size: int = 20
+    postgres_max_overflow: int = 10
+    postgres_pool_timeout: int = 30
+    postgres_pool_recycle: int = 3600
+    postgres_pool_pre_ping: bool = True
+    postgres_query_cache_size: int = 2000
+    # Set when connecting through PgBouncer in transaction pooling mode.
+    postgres_pgbouncer: bool = False
+
+    # Cache-Control max-age, in seconds, for the read-only quiz endpoints. It also
+    # bounds how long a worker serves its cached question listing; the listing's
+    # max-age shrinks by the cache's age, so a new question reaches every client
+    # within this many seconds.
+    http_cache_max_age: int = 60
+
 
 settings = Settings()
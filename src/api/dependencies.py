@@ -1,7 +1,8 @@
+from fastapi import Request
+from typing import cast
+
 from src.database.postgres.handler import PostgreSQLHandler
 
 
-async def get_postgres_dependency() -> PostgreSQLHandler:
-    db_handler = PostgreSQLHandler()
-    await db_handler.initialize()
-    return db_handler
+async def get_postgres_dependency(request: Request) -> PostgreSQLHandler:
+    return cast(PostgreSQLHandler, request.app.state.db)
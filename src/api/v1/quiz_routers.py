@@ -1,6 +1,10 @@
-from fastapi import APIRouter, Body, Depends, HTTPException
-from typing import List, Optional
+import orjson
 
+from fastapi import APIRouter, Body, Depends, HTTPException, Request, Response, status
+from pydantic import BaseModel
+from typing import List
+
+from config.base import settings
 from src.api.dependencies import get_postgres_dependency
 from src.database.postgres.handler import PostgreSQLHandler
 from src.schemas.quiz_schemas import (
@@ -9,6 +13,7 @@ from src.schemas.quiz_schemas import (
     QuestionResponse,
     QuestionSchema,
 )
+from src.utils.http_cache import build_etag
 
 router = APIRouter(
     prefix="/quiz",
@@ -16,6 +21,41 @@ router = APIRouter(
 )
 
 
+def _is_not_modified(request: Request, etag: str) -> bool:
+    """
+    Checks whether the client's If-None-Match header already matches the ETag.
+    Only call it once the representation is known to exist, since "*" matches it.
+    """
+    if not (if_none_match := request.headers.get("if-none-match")):
+        return False
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in tags or etag in tags
+
+
+def _cached_json_response(
+    request: Request, content: bytes, etag: str, age: float = 0
+) -> Response:
+    """
+    Wraps encoded JSON in a response carrying its ETag, or answers with an empty
+    304 instead if the client's copy is still current. Content that has already
+    sat in a server-side cache for `age` seconds may only be kept for the rest
+    of the max-age, so no client holds it longer than `http_cache_max_age`.
+    """
+    max_age = max(int(settings.http_cache_max_age - age), 0)
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={max_age}",
+    }
+    if _is_not_modified(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=content, media_type="application/json", headers=headers)
+
+
+def _item_response(request: Request, model: BaseModel) -> Response:
+    content = orjson.dumps(model, default=BaseModel.model_dump)
+    return _cached_json_response(request, content, build_etag(content))
+
+
 @router.post("/questions", response_model=QuestionResponse)
 async def create_question(
     request: QuestionSchema = Body(...),
@@ -31,28 +71,42 @@ async def create_question(
         QuestionResponse: The created question with its details and choices.
     """
     try:
-        return await postgres.create_question(request)  # type: ignore
+        return await postgres.create_question(request)
     except ValueError as e:
         raise HTTPException(status_code=409, detail=str(e))
 
 
-@router.get("/questions", response_model=List[QuestionResponse])
+@router.get(
+    "/questions",
+    response_model=None,
+    responses={200: {"model": List[QuestionResponse]}},
+)
 async def get_all_questions(
+    request: Request,
     postgres: PostgreSQLHandler = Depends(get_postgres_dependency),
-) -> List[QuestionResponse]:
+) -> Response:
     """
     Retrieves a list of all questions and their associated choices.
 
     Returns:
-        List[QuestionResponse]: A list of questions with their details and choices.
+        Response: A JSON list of questions with their details and choices,
+            or an empty 304 response if the client's copy is still current.
     """
-    return await postgres.get_all_questions()  # type: ignore
+    # The listing's ETag is computed once, when its cached bytes are built.
+    listing = await postgres.get_all_questions_json()
+    return _cached_json_response(request, listing.content, listing.etag, listing.age)
 
 
-@router.get("/questions/{question_id}", response_model=QuestionResponse)
+@router.get(
+    "/questions/{question_id}",
+    response_model=None,
+    responses={200: {"model": QuestionResponse}},
+)
 async def get_question(
-    question_id: int, postgres: PostgreSQLHandler = Depends(get_postgres_dependency)
-) -> QuestionResponse:
+    question_id: int,
+    request: Request,
+    postgres: PostgreSQLHandler = Depends(get_postgres_dependency),
+) -> Response:
     """
     Retrieves a single question and its associated choices based on the question ID.
 
@@ -60,20 +114,27 @@ async def get_question(
         question_id (int): The unique identifier of the question.
 
     Returns:
-        QuestionResponse: The requested question with its details and choices.
+        Response: The requested question with its details and choices,
+            or an empty 304 response if the client's copy is still current.
 
     Raises:
         HTTPException: A 404 error if the question is not found.
     """
     if question := await postgres.get_question_by_id(question_id):
-        return question  # type: ignore
+        return _item_response(request, question)
     raise HTTPException(status_code=404, detail="Question not found!")
 
 
-@router.get("/questions/{question_id}/answer", response_model=Optional[ChoiceResponse])
+@router.get(
+    "/questions/{question_id}/answer",
+    response_model=None,
+    responses={200: {"model": ChoiceResponse}},
+)
 async def get_question_answer(
-    question_id: int, postgres: PostgreSQLHandler = Depends(get_postgres_dependency)
-) -> ChoiceResponse:
+    question_id: int,
+    request: Request,
+    postgres: PostgreSQLHandler = Depends(get_postgres_dependency),
+) -> Response:
     """
     Retrieves the correct answer for a specified question.
 
@@ -81,21 +142,28 @@ async def get_question_answer(
         question_id (int): The unique identifier of the question.
 
     Returns:
-        ChoiceResponse: The correct choice for the specified question.
+        Response: The correct choice for the specified question,
+            or an empty 304 response if the client's copy is still current.
+
+    Raises:
+        HTTPException: A 404 error if the question is not found.
     """
     if answer := await postgres.get_question_answer(question_id):
-        return answer
+        return _item_response(request, answer)
     raise HTTPException(status_code=404, detail="Question not found!")
 
 
 @router.get(
-    "/questions/{question_id}/answer/{answer_id}", response_model=AnswerResponse
+    "/questions/{question_id}/answer/{answer_id}",
+    response_model=None,
+    responses={200: {"model": AnswerResponse}},
 )
 async def check_question_answer(
     question_id: int,
     answer_id: int,
+    request: Request,
     postgres: PostgreSQLHandler = Depends(get_postgres_dependency),
-) -> AnswerResponse:
+) -> Response:
     """
     Checks if the provided answer ID is the correct choice for the specified question ID.
 
@@ -104,10 +172,12 @@ async def check_question_answer(
         answer_id (int): The unique identifier of the provided answer.
 
     Returns:
-        AnswerResponse: A response indicating whether the provided answer is correct or not.
+        Response: A response indicating whether the provided answer is correct or not,
+            or an empty 304 response if the client's copy is still current.
     """
-    answer = await postgres.check_question_answer(question_id, answer_id)
-    return AnswerResponse(
-        is_correct=answer is not None,
-        message="Congrats!!!" if answer is not None else "NO!",
+    is_correct = await postgres.check_question_answer(question_id, answer_id)
+    answer = AnswerResponse(
+        is_correct=is_correct,
+        message="Congrats!!!" if is_correct else "NO!",
     )
+    return _item_response(request, answer)
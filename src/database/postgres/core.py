@@ -1,6 +1,9 @@
+import asyncio
+import functools
 import logging
 
-from typing import Optional
+from typing import Any, Dict, Optional
+from uuid import uuid4
 
 from sqlalchemy import text
 from sqlalchemy.engine.url import URL
@@ -44,7 +47,16 @@ class PostgreSQLCore:
             else self.build_db_url(database or settings.postgres_database)
         )
         self.base_model = BaseSQL
-        self.engine = create_async_engine(self.db_url)
+        self.engine = create_async_engine(
+            self.db_url,
+            pool_size=settings.postgres_pool_size,
+            max_overflow=settings.postgres_max_overflow,
+            pool_timeout=settings.postgres_pool_timeout,
+            pool_recycle=settings.postgres_pool_recycle,
+            pool_pre_ping=settings.postgres_pool_pre_ping,
+            query_cache_size=settings.postgres_query_cache_size,
+            connect_args=self.build_connect_args(),
+        )
         self.session_factory = async_sessionmaker(
             bind=self.engine, expire_on_commit=False, class_=AsyncSession
         )
@@ -53,9 +65,11 @@ class PostgreSQLCore:
         await self.create_tables()
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def build_db_url(database: str) -> URL:
         """
         Builds the database URL using the provided database name and settings.
+        URLs are immutable, so each one is built once per database name.
 
         Args:
             database (str): The name of the database.
@@ -72,6 +86,26 @@ class PostgreSQLCore:
             database=database,
         )
 
+    @staticmethod
+    def build_connect_args() -> Dict[str, Any]:
+        """
+        Builds the asyncpg connection arguments based on the settings.
+
+        Behind PgBouncer in transaction mode a server connection may change between
+        statements, so asyncpg's statement caches are disabled and prepared statements
+        get unique names.
+
+        Returns:
+            Dict[str, Any]: The keyword arguments passed to asyncpg's connect().
+        """
+        if not settings.postgres_pgbouncer:
+            return {}
+        return {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+        }
+
     async def create_tables(self) -> None:
         """
         Creates all tables in the database based on the SQLAlchemy models.
@@ -87,6 +121,23 @@ class PostgreSQLCore:
         async with self.engine.begin() as connection:
             await connection.run_sync(self.base_model.metadata.drop_all)
 
+    async def warm_up_pool(self) -> None:
+        """
+        Opens `pool_size` connections concurrently and returns them to the pool,
+        so the first requests after startup don't pay the connection handshake.
+        """
+
+        async def _connect() -> None:
+            async with self.engine.connect() as connection:
+                await connection.execute(text("SELECT 1"))
+
+        try:
+            async with asyncio.TaskGroup() as task_group:
+                for _ in range(self.engine.pool.size()):  # type: ignore
+                    task_group.create_task(_connect())
+        except* SQLAlchemyError as e:
+            logger.error(f"Database pool warm-up failed: {e.exceptions}")
+
     async def health_check(self) -> bool:
         """
         Performs a health check on the database.
@@ -1,17 +1,58 @@
 import logging
+import orjson
+import time
 
+from collections import defaultdict
+
+from pydantic import BaseModel
+from sqlalchemy import ARRAY, Integer, Row, Select, any_, bindparam, insert
 from sqlalchemy.engine.url import URL
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncConnection
 from sqlalchemy.future import select
-from sqlalchemy.orm import joinedload
-from typing import List, Optional
+from typing import DefaultDict, Dict, FrozenSet, Iterable, List, NamedTuple, Optional
 
+from config.base import settings
 from src.database.postgres.core import PostgreSQLCore
 from src.models.quiz_models import Choice, Question
-from src.schemas.quiz_schemas import ChoiceResponse, QuestionSchema
+from src.schemas.quiz_schemas import ChoiceResponse, QuestionResponse, QuestionSchema
+from src.utils.http_cache import build_etag
+from src.utils.single_flight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
+# Statements are built once so SQLAlchemy's compiled cache and asyncpg's
+# prepared-statement cache both see the same SQL on every call.
+# Ordered, so workers holding the same data encode the same listing bytes.
+_Q_QUESTIONS: Select = select(Question.id, Question.question_text).order_by(Question.id)
+_Q_ALL = _Q_QUESTIONS.execution_options(yield_per=200)
+_Q_BY_ID = _Q_QUESTIONS.where(Question.id == bindparam("question_id"))
+_Q_CHOICES: Select = (
+    select(Choice.id, Choice.question_id, Choice.choice_text, Choice.is_correct)
+    .where(Choice.question_id == any_(bindparam("question_ids", type_=ARRAY(Integer))))
+    .order_by(Choice.id)
+)
+_Q_ANSWER: Select = select(Choice.id, Choice.choice_text, Choice.is_correct).where(
+    Choice.question_id == bindparam("question_id"), Choice.is_correct.is_(True)
+)
+_Q_CORRECT_IDS = select(Choice.id).where(
+    Choice.question_id == bindparam("question_id"), Choice.is_correct.is_(True)
+)
+_INSERT_QUESTION = insert(Question).returning(Question.id)
+_INSERT_CHOICES = insert(Choice).returning(
+    Choice.id, Choice.choice_text, Choice.is_correct, sort_by_parameter_order=True
+)
+
+
+class QuestionsListing(NamedTuple):
+    content: bytes
+    etag: str
+    built_at: float  # time.monotonic() when the rebuild started
+
+    @property
+    def age(self) -> float:
+        return time.monotonic() - self.built_at
+
 
 class PostgreSQLHandler(PostgreSQLCore):
     """
@@ -27,8 +68,15 @@ class PostgreSQLHandler(PostgreSQLCore):
             database (str, optional): The name of the database to connect to. Defaults to None.
         """
         super().__init__(db_url, database)
+        self._single_flight = SingleFlight()
+        # question_id -> IDs of its correct choices; questions are never edited.
+        self._correct_answers: Dict[int, FrozenSet[int]] = {}
+        # Encoded question listing. Writes from other workers don't clear it,
+        # so it's also rebuilt once it is older than the HTTP cache max-age.
+        self._questions_json: Optional[QuestionsListing] = None
+        self._version = 0
 
-    async def create_question(self, question: QuestionSchema) -> Question:
+    async def create_question(self, question: QuestionSchema) -> QuestionResponse:
         """
         Creates a new question along with its choices in the database.
 
@@ -36,27 +84,47 @@ class PostgreSQLHandler(PostgreSQLCore):
             question (QuestionSchema): The schema of the question to be created.
 
         Returns:
-            Question: The created Question object.
+            QuestionResponse: The created question with its choices.
         """
-        question_object = Question(question_text=question.question_text)
-        for choice_schema in question.choices:
-            _choice = Choice(
-                choice_text=choice_schema.choice_text,
-                is_correct=choice_schema.is_correct,
-            )
-            question_object.choices.append(_choice)
-
         async with self.session_factory() as session:
             try:
-                session.add(question_object)
+                question_id = (
+                    await session.execute(
+                        _INSERT_QUESTION, {"question_text": question.question_text}
+                    )
+                ).scalar_one()
+                choices = []
+                if question.choices:
+                    # One multi-row INSERT ... RETURNING for all of the choices.
+                    rows = await session.execute(
+                        _INSERT_CHOICES,
+                        [
+                            {"question_id": question_id, **choice.model_dump()}
+                            for choice in question.choices
+                        ],
+                    )
+                    choices = [
+                        ChoiceResponse.model_construct(**row._mapping) for row in rows
+                    ]
                 await session.commit()
-                await session.refresh(question_object, attribute_names=["choices"])
-                return question_object
             except IntegrityError:
                 await session.rollback()  # Rollback the transaction
                 raise ValueError("A question with this text already exists.")
 
-    async def get_all_questions(self, search_text: str = None) -> List[Question]:
+        self._correct_answers[question_id] = frozenset(
+            choice.id for choice in choices if choice.is_correct
+        )
+        self._version += 1
+        self._questions_json = None
+        # Reads that started before this write must not be shared further.
+        self._single_flight.forget()
+        return QuestionResponse.model_construct(
+            id=question_id, question_text=question.question_text, choices=choices
+        )
+
+    async def get_all_questions(
+        self, search_text: str = None
+    ) -> List[QuestionResponse]:
         """
         Retrieves all questions from the database, including their choices.
 
@@ -64,16 +132,45 @@ class PostgreSQLHandler(PostgreSQLCore):
             search_text (str, optional): A string to search for in question_text. Defaults to None.
 
         Returns:
-            List[Question]: A list of all questions with their choices.
+            List[QuestionResponse]: A list of all questions with their choices.
         """
-        async with self.session_factory() as session:
-            query = select(Question).options(joinedload(Question.choices))
-            if search_text:
-                query = query.filter(Question.question_text.ilike(f"%{search_text}%"))
-            questions = await session.execute(query)
-            return list(questions.unique().scalars().all())
+        query = _Q_ALL
+        if search_text:
+            query = query.where(Question.question_text.ilike(f"%{search_text}%"))
+        questions: List[QuestionResponse] = []
+        async with self.engine.connect() as connection:
+            result = await connection.stream(query)
+            async for rows in result.partitions():
+                questions.extend(await self._load_questions(connection, rows))
+        return questions
+
+    async def get_all_questions_json(self) -> QuestionsListing:
+        """
+        Retrieves all questions with their choices as an encoded JSON array.
+        The bytes are cached until this handler creates a question, or for at most
+        `http_cache_max_age` seconds, so writes made by other workers show up too.
+
+        Returns:
+            QuestionsListing: The JSON-encoded list of questions, its ETag and age.
+        """
+        listing = self._questions_json
+        if listing is None or listing.age >= settings.http_cache_max_age:
+            return await self._single_flight.do(
+                "questions_json", self._build_questions_json
+            )
+        return listing
+
+    async def _build_questions_json(self) -> QuestionsListing:
+        version, built_at = self._version, time.monotonic()
+        questions = await self.get_all_questions()
+        content = orjson.dumps(questions, default=BaseModel.model_dump)
+        listing = QuestionsListing(content, build_etag(content), built_at)
+        # A write that landed while this was loading makes the result stale.
+        if version == self._version:
+            self._questions_json = listing
+        return listing
 
-    async def get_question_by_id(self, question_id: int) -> Optional[Question]:
+    async def get_question_by_id(self, question_id: int) -> Optional[QuestionResponse]:
         """
         Retrieves a question by its ID, including its choices.
 
@@ -81,18 +178,50 @@ class PostgreSQLHandler(PostgreSQLCore):
             question_id (int): The ID of the question to be retrieved.
 
         Returns:
-            Optional[Question]: The retrieved Question object, or None if not found.
+            Optional[QuestionResponse]: The retrieved question, or None if not found.
         """
-        async with self.session_factory() as session:
-            query = (
-                select(Question)
-                .options(joinedload(Question.choices))
-                .filter(Question.id == question_id)
+        return await self._single_flight.do(
+            ("question", question_id), lambda: self._fetch_question_by_id(question_id)
+        )
+
+    async def _fetch_question_by_id(
+        self, question_id: int
+    ) -> Optional[QuestionResponse]:
+        async with self.engine.connect() as connection:
+            rows = await connection.execute(_Q_BY_ID, {"question_id": question_id})
+            questions = await self._load_questions(connection, rows)
+        return questions[0] if questions else None
+
+    @staticmethod
+    async def _load_questions(
+        connection: AsyncConnection, rows: Iterable[Row]
+    ) -> List[QuestionResponse]:
+        """
+        Builds responses for the given question rows, loading all of their choices
+        with a single query and grouping them by question_id.
+        """
+        if not (rows := list(rows)):
+            return []
+        choices: DefaultDict[int, List[ChoiceResponse]] = defaultdict(list)
+        for choice in await connection.execute(
+            _Q_CHOICES, {"question_ids": [row.id for row in rows]}
+        ):
+            # Rows come straight from the database, so validation is skipped.
+            choices[choice.question_id].append(
+                ChoiceResponse.model_construct(
+                    id=choice.id,
+                    choice_text=choice.choice_text,
+                    is_correct=choice.is_correct,
+                )
             )
-            question = (await session.execute(query)).scalar()
-        return question if question else None
+        return [
+            QuestionResponse.model_construct(
+                id=row.id, question_text=row.question_text, choices=choices[row.id]
+            )
+            for row in rows
+        ]
 
-    async def get_question_answer(self, question_id: int) -> ChoiceResponse:
+    async def get_question_answer(self, question_id: int) -> Optional[ChoiceResponse]:
         """
         Retrieves the correct choice for a given question ID.
 
@@ -100,16 +229,22 @@ class PostgreSQLHandler(PostgreSQLCore):
             question_id (int): The ID of the question.
 
         Returns:
-            ChoiceResponse: The correct choice for the question.
+            Optional[ChoiceResponse]: The correct choice for the question, or None if not found.
         """
-        async with self.session_factory() as session:
-            query = select(Choice).filter(
-                Choice.question_id == question_id, Choice.is_correct.is_(True)
-            )
-            answer = (await session.execute(query)).scalar()
-        return answer  # type: ignore
+        return await self._single_flight.do(
+            ("answer", question_id), lambda: self._fetch_question_answer(question_id)
+        )
+
+    async def _fetch_question_answer(
+        self, question_id: int
+    ) -> Optional[ChoiceResponse]:
+        async with self.engine.connect() as connection:
+            answer = (
+                await connection.execute(_Q_ANSWER, {"question_id": question_id})
+            ).first()
+        return ChoiceResponse.model_construct(**answer._mapping) if answer else None
 
-    async def check_question_answer(self, question_id: int, answer_id: int) -> Choice:
+    async def check_question_answer(self, question_id: int, answer_id: int) -> bool:
         """
         Checks if the provided answer ID is correct for the given question ID.
 
@@ -118,13 +253,22 @@ class PostgreSQLHandler(PostgreSQLCore):
             answer_id (int): The ID of the answer to check.
 
         Returns:
-            Choice: The correct choice if the answer is correct, otherwise None.
+            bool: True if the answer is a correct choice for the question, otherwise False.
         """
-        async with self.session_factory() as session:
-            query = select(Choice).filter(
-                Choice.question_id == question_id,
-                Choice.id == answer_id,
-                Choice.is_correct.is_(True),
+        if (correct_answers := self._correct_answers.get(question_id)) is None:
+            correct_answers = await self._single_flight.do(
+                ("correct", question_id),
+                lambda: self._fetch_correct_answers(question_id),
+            )
+        return answer_id in correct_answers
+
+    async def _fetch_correct_answers(self, question_id: int) -> FrozenSet[int]:
+        async with self.engine.connect() as connection:
+            result = await connection.execute(
+                _Q_CORRECT_IDS, {"question_id": question_id}
             )
-            answer = (await session.execute(query)).scalar()
-        return answer if answer else None
+            correct_answers = frozenset(result.scalars())
+        # Unknown IDs aren't remembered, so arbitrary lookups can't grow the map.
+        if correct_answers:
+            self._correct_answers[question_id] = correct_answers
+        return correct_answers
@@ -2,7 +2,7 @@ from logging import config, getLogger
 
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
-from fastapi.responses import RedirectResponse
+from fastapi.responses import ORJSONResponse, RedirectResponse
 
 from src.api.v1.quiz_routers import router as v1_quiz_router
 from src.database.postgres.handler import PostgreSQLHandler
@@ -16,16 +16,18 @@ logger = getLogger(__name__)
 async def lifespan(app: FastAPI):
     # startup-event
 
-    db_handler = PostgreSQLHandler()
-    await db_handler.initialize()
-    logger.info(f"Database Health-Check: {await db_handler.health_check()}")
+    app.state.db = PostgreSQLHandler()
+    await app.state.db.initialize()
+    await app.state.db.warm_up_pool()
+    logger.info(f"Database Health-Check: {await app.state.db.health_check()}")
 
     yield
 
     # shutdown-event
+    await app.state.db.engine.dispose()
 
 
-app = FastAPI(lifespan=lifespan)
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
 app.include_router(v1_quiz_router, prefix="/v1")
 
@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, Column, ForeignKey, Integer, String
+from sqlalchemy import Boolean, Column, ForeignKey, Index, Integer, String, text
 from sqlalchemy.orm import relationship
 
 from src.database.dependencies import BaseSQL
@@ -15,8 +15,15 @@ class Question(BaseSQL):
 
 class Choice(BaseSQL):
     __tablename__ = "choices"
+    __table_args__ = (
+        Index(
+            "ix_choices_question_id_correct",
+            "question_id",
+            postgresql_where=text("is_correct IS TRUE"),
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     choice_text = Column(String, index=True)
     is_correct = Column(Boolean, default=False)
-    question_id = Column(Integer, ForeignKey("questions.id"))
+    question_id = Column(Integer, ForeignKey("questions.id"), index=True)
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel
 from typing import List, Optional
 
 
@@ -13,8 +13,6 @@ class QuestionSchema(BaseModel):
 
 
 class ChoiceResponse(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
-
     id: int
     choice_text: str
     is_correct: bool
@@ -0,0 +1,15 @@
+import hashlib
+
+
+def build_etag(content: bytes) -> str:
+    """
+    Builds a strong ETag from a hash of an encoded representation, so every
+    worker serving the same bytes hands out the same tag.
+
+    Args:
+        content (bytes): The encoded response body.
+
+    Returns:
+        str: The quoted entity tag.
+    """
+    return f'"{hashlib.blake2b(content, digest_size=16).hexdigest()}"'
@@ -0,0 +1,45 @@
+import asyncio
+
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls that share a key into a single awaitable.
+
+    While a call for a key is in flight, later callers with the same key await
+    its result instead of starting their own. Nothing is kept once it finishes.
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, asyncio.Future[Any]] = {}
+
+    async def do(self, key: Hashable, function: Callable[[], Awaitable[T]]) -> T:
+        """
+        Runs `function` for `key`, or joins the call already in flight for it.
+
+        Args:
+            key (Hashable): Identifies calls that are interchangeable.
+            function (Callable[[], Awaitable[T]]): Produces the awaitable to run.
+
+        Returns:
+            T: The result shared by every caller of the same flight.
+        """
+        if (call := self._calls.get(key)) is None:
+            call = asyncio.ensure_future(function())
+            self._calls[key] = call
+            call.add_done_callback(lambda _: self._discard(key, call))
+        # A cancelled caller must not cancel the flight the others are awaiting.
+        return await asyncio.shield(call)
+
+    def forget(self) -> None:
+        """
+        Detaches every call in flight, so subsequent callers start fresh ones.
+        """
+        self._calls.clear()
+
+    def _discard(self, key: Hashable, call: asyncio.Future[Any]) -> None:
+        if self._calls.get(key) is call:
+            del self._calls[key]
@@ -2,6 +2,9 @@ import pytest
 
 from fastapi import status
 
+from config.base import settings
+from src.api.dependencies import get_postgres_dependency
+
 
 @pytest.mark.asyncio(scope="module")
 async def test_create_question(async_client_v1, question_item_json):
@@ -70,3 +73,70 @@ async def test_check_question_answer(async_client_v1, question_item_json):
     assert response.status_code == status.HTTP_200_OK
     api_response = response.json()
     assert not api_response["is_correct"]
+
+
+@pytest.mark.asyncio(scope="module")
+async def test_questions_etag(async_client_v1, question_item_json):
+    response = await async_client_v1.get("/quiz/questions/1")
+    etag = response.headers["etag"]
+    assert response.headers["cache-control"].startswith("public, max-age=")
+
+    response = await async_client_v1.get(
+        "/quiz/questions/1", headers={"If-None-Match": etag}
+    )
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.headers["etag"] == etag
+
+    # Creating a question changes the ETag of the listing
+    response = await async_client_v1.get("/quiz/questions")
+    etag = response.headers["etag"]
+    await async_client_v1.post(
+        "/quiz/questions",
+        json={**question_item_json, "question_text": "What is the capital of Italy?"},
+    )
+    response = await async_client_v1.get(
+        "/quiz/questions", headers={"If-None-Match": etag}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["etag"] != etag
+    assert len(response.json()) == 2
+
+
+@pytest.mark.asyncio(scope="module")
+async def test_questions_etag_wildcard(async_client_v1):
+    # "*" only matches a question that exists
+    response = await async_client_v1.get(
+        "/quiz/questions/1", headers={"If-None-Match": "*"}
+    )
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    response = await async_client_v1.get(
+        "/quiz/questions/999", headers={"If-None-Match": "*"}
+    )
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    response = await async_client_v1.get(
+        "/quiz/questions/999/answer", headers={"If-None-Match": "*"}
+    )
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.asyncio(scope="module")
+async def test_questions_max_age_counts_cache_age(app, async_client_v1, monkeypatch):
+    def max_age(response):
+        return int(response.headers["cache-control"].split("max-age=")[1])
+
+    monkeypatch.setattr(settings, "http_cache_max_age", 60)
+    response = await async_client_v1.get("/quiz/questions")
+    assert max_age(response) in (59, 60)
+
+    # A listing that has sat in the cache for 45 seconds may only be kept for 15 more
+    postgres = await app.dependency_overrides[get_postgres_dependency]()
+    listing = await postgres.get_all_questions_json()
+    postgres._questions_json = listing._replace(built_at=listing.built_at - 45)
+    response = await async_client_v1.get("/quiz/questions")
+    assert max_age(response) in (14, 15)
+
+    # Per-item responses are read fresh, so they get the full max-age
+    response = await async_client_v1.get("/quiz/questions/1")
+    assert max_age(response) == 60
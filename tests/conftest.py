@@ -10,13 +10,15 @@ from src.schemas.quiz_schemas import QuestionSchema, ChoiceSchema
 
 
 @pytest_asyncio.fixture(scope="module")
-async def override_get_postgres_dependency() -> Callable:
+async def override_get_postgres_dependency() -> AsyncGenerator:
+    db_handler = PostgreSQLHandler(database="test_quiz_db")
+    await db_handler.initialize()
+
     async def _override_get_postgres_dependency():
-        db_handler = PostgreSQLHandler(database="test_quiz_db")
-        await db_handler.initialize()
         return db_handler
 
-    return _override_get_postgres_dependency
+    yield _override_get_postgres_dependency
+    await db_handler.engine.dispose()
 
 
 @pytest_asyncio.fixture(scope="module")
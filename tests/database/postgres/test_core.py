@@ -31,6 +31,12 @@ async def test_health_check(postgres):
     assert result is True
 
 
+@pytest.mark.asyncio(scope="session")
+async def test_warm_up_pool(postgres):
+    await postgres.warm_up_pool()
+    assert postgres.engine.pool.checkedin() == postgres.engine.pool.size()
+
+
 @pytest.mark.asyncio(scope="session")
 async def test_drop_tables(postgres):
     await postgres.drop_tables()
@@ -1,6 +1,20 @@
+import asyncio
+import orjson
 import pytest
 
+from contextlib import contextmanager
+from sqlalchemy import event, text
+
+from config.base import settings
+from src.database.postgres.handler import (
+    PostgreSQLHandler,
+    _Q_ALL,
+    _Q_ANSWER,
+    _Q_CORRECT_IDS,
+)
 from src.models.quiz_models import Choice, Question
+from src.schemas.quiz_schemas import ChoiceSchema, QuestionResponse, QuestionSchema
+from src.utils.http_cache import build_etag
 
 
 @pytest.mark.asyncio(scope="session")
@@ -10,6 +24,7 @@ async def test_create_question(postgres, question_item_schema):
     # Check if the question is created successfully
     assert created_question.question_text == "What is the capital of France?"
     assert len(created_question.choices) == 3
+    assert all(choice.id is not None for choice in created_question.choices)
 
     questions = await postgres.get_all_questions()
     # Check if questions are retrieved successfully
@@ -39,7 +54,34 @@ async def test_get_all_questions(postgres):
     questions = await postgres.get_all_questions(search_text="Question #")
     # Check if questions are retrieved successfully
     assert len(questions) == 2
-    assert all(isinstance(q, Question) for q in questions)
+    assert all(isinstance(q, QuestionResponse) for q in questions)
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_get_all_questions_across_partitions(postgres):
+    # More rows than fit in two streamed partitions, so choices are loaded per batch
+    count = 2 * _Q_ALL.get_execution_options()["yield_per"] + 50
+    async with postgres.session_factory() as session:
+        for number in range(count):
+            question = Question(question_text=f"Partition question {number}")
+            question.choices.extend(
+                [
+                    Choice(choice_text=f"Right {number}", is_correct=True),
+                    Choice(choice_text=f"Wrong {number}", is_correct=False),
+                ]
+            )
+            session.add(question)
+        await session.commit()
+
+    questions = await postgres.get_all_questions(search_text="Partition question")
+    assert len(questions) == count
+    # Every question got exactly its own choices, not a neighbour's from another batch
+    for question in questions:
+        number = question.question_text.removeprefix("Partition question ")
+        assert [(c.choice_text, c.is_correct) for c in question.choices] == [
+            (f"Right {number}", True),
+            (f"Wrong {number}", False),
+        ]
 
 
 @pytest.mark.asyncio(scope="session")
@@ -55,6 +97,12 @@ async def test_get_question_by_id(postgres):
     # Check if the question is retrieved successfully
     assert retrieved_question.question_text == "Test first question"
 
+    # Concurrent lookups for the same ID share a single query
+    results = await asyncio.gather(
+        *(postgres.get_question_by_id(question.id) for _ in range(5))
+    )
+    assert all(result is results[0] for result in results)
+
 
 @pytest.mark.asyncio(scope="session")
 async def test_get_question_answer(postgres):
@@ -87,11 +135,135 @@ async def test_check_question_answer(postgres):
         question_id=question.id, answer_id=choice.id
     )
     # Check if the correct choice is validated successfully
-    assert correct_choice is not None
+    assert correct_choice is True
 
     # Check if an incorrect choice is validated
     incorrect_choice = await postgres.check_question_answer(
         question_id=question.id, answer_id=99999
     )
     # Check if the incorrect choice is not validated
-    assert incorrect_choice is None
+    assert incorrect_choice is False
+
+
+@contextmanager
+def count_statements(postgres):
+    statements = []
+
+    def _before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engine = postgres.engine.sync_engine
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", _before_cursor_execute)
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_check_question_answer_from_memory(postgres):
+    # A question may have more than one correct choice
+    question = await postgres.create_question(
+        QuestionSchema(
+            question_text="Which of these are primary colours?",
+            choices=[
+                ChoiceSchema(choice_text="Red", is_correct=True),
+                ChoiceSchema(choice_text="Blue", is_correct=True),
+                ChoiceSchema(choice_text="Green", is_correct=False),
+            ],
+        )
+    )
+    correct_ids = {choice.id for choice in question.choices if choice.is_correct}
+    assert postgres._correct_answers[question.id] == correct_ids
+
+    # create_question filled the map, so checking answers never queries the database
+    with count_statements(postgres) as statements:
+        for choice in question.choices:
+            is_correct = await postgres.check_question_answer(question.id, choice.id)
+            assert is_correct is choice.is_correct
+    assert statements == []
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_check_question_answer_loads_once(postgres):
+    # Questions written by another worker are loaded on the first check only
+    question = Question(question_text="Which of these are even numbers?")
+    question.choices.extend(
+        [
+            Choice(choice_text="Two", is_correct=True),
+            Choice(choice_text="Four", is_correct=True),
+            Choice(choice_text="Five", is_correct=False),
+        ]
+    )
+    async with postgres.session_factory() as session:
+        session.add(question)
+        await session.commit()
+
+    with count_statements(postgres) as statements:
+        for _ in range(2):
+            for choice in question.choices:
+                is_correct = await postgres.check_question_answer(
+                    question.id, choice.id
+                )
+                assert is_correct is choice.is_correct
+    assert len(statements) == 1
+    assert postgres._correct_answers[question.id] == {
+        question.choices[0].id,
+        question.choices[1].id,
+    }
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_get_all_questions_json(postgres, question_item_schema):
+    content, etag, _ = await postgres.get_all_questions_json()
+    questions = orjson.loads(content)
+    assert len(questions) == len(await postgres.get_all_questions())
+    assert set(questions[0]) == {"id", "question_text", "choices"}
+    assert [q["id"] for q in questions] == sorted(q["id"] for q in questions)
+    assert etag == build_etag(content)
+
+    # Another worker holding the same data serves the same bytes and ETag
+    other_worker = PostgreSQLHandler(database="test_quiz_db")
+    other_listing = await other_worker.get_all_questions_json()
+    assert (other_listing.content, other_listing.etag) == (content, etag)
+    await other_worker.engine.dispose()
+
+    # Creating a question invalidates the cached listing
+    await postgres.create_question(
+        question_item_schema.model_copy(update={"question_text": "Cache question"})
+    )
+    refreshed = orjson.loads((await postgres.get_all_questions_json()).content)
+    assert len(refreshed) == len(questions) + 1
+    assert "Cache question" in {q["question_text"] for q in refreshed}
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_get_all_questions_json_expires(postgres, monkeypatch):
+    monkeypatch.setattr(settings, "http_cache_max_age", 60)
+    cached = await postgres.get_all_questions_json()
+
+    # A write made by another worker doesn't clear this handler's listing...
+    async with postgres.session_factory() as session:
+        session.add(Question(question_text="Other worker question"))
+        await session.commit()
+    assert await postgres.get_all_questions_json() == cached
+
+    # ...but the listing is rebuilt once it outlives the max-age
+    monkeypatch.setattr(settings, "http_cache_max_age", 0)
+    refreshed = orjson.loads((await postgres.get_all_questions_json()).content)
+    assert "Other worker question" in {q["question_text"] for q in refreshed}
+
+
+@pytest.mark.asyncio(scope="session")
+@pytest.mark.parametrize("query", [_Q_ANSWER, _Q_CORRECT_IDS])
+async def test_correct_choice_lookup_uses_partial_index(postgres, query):
+    statement = query.params(question_id=1).compile(
+        postgres.engine, compile_kwargs={"literal_binds": True}
+    )
+    async with postgres.engine.connect() as connection:
+        await connection.execute(text("SET LOCAL enable_seqscan = off"))
+        plan = (await connection.execute(text(f"EXPLAIN {statement}"))).scalars()
+        plan = "\n".join(plan)
+
+    assert "ix_choices_question_id_correct" in plan
+    assert "Filter" not in plan
@@ -0,0 +1,74 @@
+import asyncio
+import pytest
+
+from src.utils.single_flight import SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_are_coalesced():
+    single_flight = SingleFlight()
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return calls
+
+    results = await asyncio.gather(*(single_flight.do("key", fetch) for _ in range(10)))
+    assert results == [1] * 10
+    assert calls == 1
+
+    # Once the flight has landed, the next call runs again
+    assert await single_flight.do("key", fetch) == 2
+
+
+@pytest.mark.asyncio
+async def test_distinct_keys_run_separately():
+    single_flight = SingleFlight()
+
+    async def fetch(value):
+        await asyncio.sleep(0.01)
+        return value
+
+    results = await asyncio.gather(
+        single_flight.do(1, lambda: fetch(1)), single_flight.do(2, lambda: fetch(2))
+    )
+    assert results == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_errors_are_shared():
+    single_flight = SingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    results = await asyncio.gather(
+        single_flight.do("key", fail),
+        single_flight.do("key", fail),
+        return_exceptions=True,
+    )
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_forget_starts_a_new_flight():
+    single_flight = SingleFlight()
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        call = calls
+        await asyncio.sleep(0.01)
+        return call
+
+    first = asyncio.ensure_future(single_flight.do("key", fetch))
+    await asyncio.sleep(0)
+    single_flight.forget()
+    second = await single_flight.do("key", fetch)
+
+    assert await first == 1
+    assert second == 2